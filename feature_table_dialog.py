@@ -7,7 +7,7 @@
                               -------------------------
  Description:
     This module implements the FeatureTableDialog for the JD Boundary Uploader plugin.
-    It extracts boundary shapefiles from a ZIP archive, creates a memory layer, and provides
+    It reads boundary shapefiles from a ZIP archive, creates a memory layer, and provides
     an interactive interface for editing attributes (Client Name, Farm Name, Field Name, and Group).
     It also supports grouping, merging (and undoing merge operations), and exporting the final 
     shapefile along with metadata (in JSON) packaged in a ZIP file.
@@ -29,47 +29,347 @@ from collections import defaultdict
 
 # PyQt modules
 from PyQt5.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem,
-    QHeaderView, QLabel, QPushButton, QFileDialog, QMessageBox, QLineEdit, QInputDialog, QAbstractItemView
+    QDialog, QVBoxLayout, QHBoxLayout, QTableView,
+    QHeaderView, QLabel, QPushButton, QFileDialog, QMessageBox, QLineEdit, QInputDialog, QAbstractItemView,
+    QProgressBar
+)
+from PyQt5.QtCore import (
+    Qt, QVariant, QAbstractTableModel, QModelIndex, QTimer, QSize, QItemSelection, QItemSelectionModel
 )
-from PyQt5.QtCore import Qt, QVariant
 from PyQt5.QtGui import QColor, QFont
 
 # QGIS modules
 from qgis.core import (
     QgsVectorLayer, QgsProject, QgsVectorFileWriter, QgsFeature, QgsFields, QgsField,
     QgsWkbTypes, QgsSymbol, QgsRendererCategory, QgsCategorizedSymbolRenderer,
-    QgsPalLayerSettings, QgsTextFormat, QgsVectorLayerSimpleLabeling, QgsCoordinateTransform
+    QgsPalLayerSettings, QgsTextFormat, QgsVectorLayerSimpleLabeling,
+    QgsFeatureRequest, QgsGeometry, QgsTask, QgsApplication
 )
 from qgis.utils import iface
 
+# Delays (ms) used to coalesce bursts of selection events before touching the map
+SELECTION_SYNC_DELAY = 75
+ZOOM_DELAY = 200
+# Ingest tasks still running. The task manager owns the C++ task, but the Python
+# object (and the features it collects) must be kept alive until the task ends,
+# even when the dialog that started it has been released.
+RUNNING_TASKS = set()
+
 # -----------------------------------------------------------------------------
 # FUNCTION: zoomToWorkingLayer
 # -----------------------------------------------------------------------------
 # Description:
 #   Forces the map canvas to zoom to the extent of the provided layer.
-#   Transforms the layer's extent to the canvas CRS if necessary.
+#   The canvas map settings transform the layer's extent to the canvas CRS,
+#   reusing the transforms QGIS caches per CRS pair.
 def zoomToWorkingLayer(layer):
-    crs_dest = iface.mapCanvas().mapSettings().destinationCrs()
-    crs_src = layer.crs()
-    if crs_src != crs_dest:
-        transform = QgsCoordinateTransform(crs_src, crs_dest, QgsProject.instance())
-        extent = transform.transformBoundingBox(layer.extent())
-    else:
-        extent = layer.extent()
-    iface.mapCanvas().setExtent(extent)
-    iface.mapCanvas().refresh()
+    canvas = iface.mapCanvas()
+    canvas.setExtent(canvas.mapSettings().layerExtentToOutputExtent(layer, layer.extent()))
+    canvas.refresh()
+
+# -----------------------------------------------------------------------------
+# FUNCTION: polygon_type
+# -----------------------------------------------------------------------------
+# Description:
+#   Returns the POLYGONTYP value for a WKB type: 2 for multipolygons,
+#   1 for single polygons and 0 for any other geometry type.
+def polygon_type(wkb_type):
+    if QgsWkbTypes.geometryType(wkb_type) != QgsWkbTypes.PolygonGeometry:
+        return 0
+    return 2 if QgsWkbTypes.isMultiType(wkb_type) else 1
+
+# -----------------------------------------------------------------------------
+# FUNCTION: find_shapefile_member
+# -----------------------------------------------------------------------------
+# Description:
+#   Returns the name of the first .shp member listed in the ZIP central
+#   directory, or None if the archive contains no shapefile. Nothing is extracted.
+def find_shapefile_member(zip_path):
+    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+        return next((name for name in zip_ref.namelist() if name.lower().endswith('.shp')), None)
+
+# -----------------------------------------------------------------------------
+# FUNCTION: extract_shapefile
+# -----------------------------------------------------------------------------
+# Description:
+#   Extracts the given .shp member and its sidecar files (same base name) from
+#   the ZIP into a new temporary directory and returns the extracted .shp path.
+def extract_shapefile(zip_path, shp_member):
+    temp_dir = tempfile.mkdtemp(prefix="FADQ_")
+    base_name = os.path.splitext(shp_member)[0].lower()
+    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+        for name in zip_ref.namelist():
+            if os.path.splitext(name)[0].lower() == base_name:
+                zip_ref.extract(name, temp_dir)
+    return os.path.join(temp_dir, shp_member)
+
+# -----------------------------------------------------------------------------
+# FUNCTION: working_layer_fields
+# -----------------------------------------------------------------------------
+# Description:
+#   Returns the fields of the working layer.
+def working_layer_fields():
+    fields = QgsFields()
+    fields.append(QgsField("CLIENT_NAME", QVariant.String))
+    fields.append(QgsField("FARM_NAME", QVariant.String))
+    fields.append(QgsField("FIELD_NAME", QVariant.String))
+    # POLYGONTYP is kept in the layer but not displayed in the widget
+    fields.append(QgsField("POLYGONTYP", QVariant.LongLong))
+    fields.append(QgsField("GROUPE", QVariant.String))
+    return fields
 
 # -----------------------------------------------------------------------------
-# FUNCTION: clone_feature
+# CLASS: IngestTask
 # -----------------------------------------------------------------------------
 # Description:
-#   Creates and returns a clone of the given QgsFeature.
-def clone_feature(feat):
-    new_feat = QgsFeature(feat.fields())
-    new_feat.setGeometry(feat.geometry())
-    new_feat.setAttributes(feat.attributes())
-    return new_feat
+#   Background task reading the shapefile found in a FADQ ZIP (in place through
+#   GDAL's /vsizip/ virtual file system, or extracted to a temporary directory if
+#   that fails) and converting its features to working layer features: FIELD_NAME
+#   is filled from NOPAR and POLYGONTYP is computed from the geometry type.
+#   The memory layer itself is created on the GUI thread once the task completes.
+class IngestTask(QgsTask):
+    PROGRESS_STEP = 500
+
+    def __init__(self, zip_path):
+        super(IngestTask, self).__init__("Loading FADQ ZIP", QgsTask.CanCancel)
+        self.zip_path = zip_path
+        self.fields = working_layer_fields()
+        self.wkb_type = QgsWkbTypes.Unknown
+        self.features = []
+        # Bounding box of each feature, in the same order as features
+        self.bboxes = []
+        # Message reported to the user when the task fails
+        self.error = None
+
+    def run(self):
+        try:
+            shp_member = find_shapefile_member(self.zip_path)
+            if not shp_member:
+                self.error = "No .shp file found in ZIP."
+                return False
+            orig_layer = QgsVectorLayer(f"/vsizip/{self.zip_path}/{shp_member}", "Input Layer", "ogr")
+            if not orig_layer.isValid():
+                # Fall back to extracting the shapefile, e.g. when GDAL decodes member names differently
+                orig_layer = QgsVectorLayer(extract_shapefile(self.zip_path, shp_member), "Input Layer", "ogr")
+        except zipfile.BadZipFile:
+            self.error = "The selected file is not a valid ZIP archive."
+            return False
+        except OSError as e:
+            self.error = f"Could not read the ZIP file: {e}"
+            return False
+        if not orig_layer.isValid():
+            self.error = "The shapefile in the ZIP is not valid."
+            return False
+
+        self.wkb_type = orig_layer.wkbType()
+        nopar_idx = orig_layer.fields().indexOf("NOPAR")
+        # Every feature of a shapefile shares the layer's geometry type
+        poly_type = polygon_type(self.wkb_type)
+        # Only the geometry and NOPAR are read from the source shapefile
+        request = QgsFeatureRequest().setSubsetOfAttributes([nopar_idx] if nopar_idx != -1 else [])
+        # Only used for progress: the count may be unknown (-1) or inexact
+        count = orig_layer.featureCount()
+        features = []
+        bboxes = []
+        for i, feat in enumerate(orig_layer.getFeatures(request)):
+            if i % self.PROGRESS_STEP == 0:
+                if self.isCanceled():
+                    return False
+                if count > 0:
+                    self.setProgress(min(100.0, 100.0 * i / count))
+            geometry = feat.geometry()
+            new_feat = QgsFeature(self.fields)
+            new_feat.setGeometry(geometry)
+            # CLIENT_NAME, FARM_NAME, FIELD_NAME, POLYGONTYP, GROUPE
+            new_feat.setAttributes(["", "", feat[nopar_idx] if nopar_idx != -1 else "", poly_type, ""])
+            features.append(new_feat)
+            bboxes.append(geometry.boundingBox())
+        self.features = features
+        self.bboxes = bboxes
+        return True
+
+# -----------------------------------------------------------------------------
+# CLASS: FeatureModel
+# -----------------------------------------------------------------------------
+# Description:
+#   Table model exposing the editable attributes of the working layer
+#   (Client Name, Farm Name, Field Name and Group) to a QTableView.
+#   Only feature ids are read up front; the attributes of a row are fetched
+#   the first time the view asks for one of its cells and are then cached.
+#   Edits stay in that cache until saveEdits writes them back to the layer.
+class FeatureModel(QAbstractTableModel):
+    COLUMNS = ["CLIENT_NAME", "FARM_NAME", "FIELD_NAME", "GROUPE"]
+    # Fixed header size hint, so the view never sizes columns from cell contents
+    HEADER_SIZE_HINT = QSize(120, 20)
+
+    def __init__(self, parent=None):
+        super(FeatureModel, self).__init__(parent)
+        self.layer = None
+        self.feat_ids = []
+        # Cached attribute values per row, None until the row is first requested
+        self.rows = []
+        self.row_by_fid = {}
+        self._field_idx = []
+        # Columns edited since the last save, by feature id
+        self._edited = defaultdict(set)
+
+    # Method: loadLayer
+    # Description:
+    #   Replaces the model content with the features of the given layer.
+    def loadLayer(self, layer):
+        self.beginResetModel()
+        self.layer = layer
+        fields = layer.fields()
+        self._field_idx = [fields.indexOf(name) for name in self.COLUMNS]
+        self.feat_ids = sorted(layer.allFeatureIds())
+        self.rows = [None] * len(self.feat_ids)
+        self._edited.clear()
+        self._indexRows()
+        self.endResetModel()
+
+    # Method: clear
+    # Description:
+    #   Empties the model, e.g. while the working layer is being replaced.
+    def clear(self):
+        self.beginResetModel()
+        self.layer = None
+        self.feat_ids = []
+        self.rows = []
+        self.row_by_fid = {}
+        self._edited.clear()
+        self.endResetModel()
+
+    # Method: _indexRows
+    # Description:
+    #   Rebuilds the feature id -> row lookup after rows are loaded or reordered.
+    def _indexRows(self):
+        self.row_by_fid = {fid: i for i, fid in enumerate(self.feat_ids)}
+
+    # Method: _attributeRequest
+    # Description:
+    #   Returns a request fetching the given attributes without geometry.
+    def _attributeRequest(self, attributes):
+        return QgsFeatureRequest().setFlags(QgsFeatureRequest.NoGeometry).setSubsetOfAttributes(attributes)
+
+    # Method: _row
+    # Description:
+    #   Returns the cached values of a row, fetching them from the layer on first access.
+    def _row(self, row):
+        if self.rows[row] is None:
+            self._loadRows([row])
+        return self.rows[row]
+
+    # Method: _loadRows
+    # Description:
+    #   Fetches the values of the given rows that are not cached yet, in a single
+    #   request, and caches them.
+    def _loadRows(self, rows):
+        missing = {self.feat_ids[row]: row for row in rows if self.rows[row] is None}
+        if not missing:
+            return
+        for row in missing.values():
+            self.rows[row] = [""] * len(self.COLUMNS)
+        request = self._attributeRequest(self._field_idx).setFilterFids(list(missing))
+        for feat in self.layer.getFeatures(request):
+            attrs = feat.attributes()
+            self.rows[missing[feat.id()]] = [attrs[idx] or "" for idx in self._field_idx]
+
+    # Method: setValues
+    # Description:
+    #   Sets the given {column: value} on every given row, e.g. to apply a value
+    #   to a whole selection. Missing rows are fetched in one request and a single
+    #   dataChanged covers all the edited cells.
+    def setValues(self, rows, values):
+        rows = sorted(set(rows))
+        if not rows or not values:
+            return
+        self._loadRows(rows)
+        for row in rows:
+            cached = self.rows[row]
+            edited = self._edited[self.feat_ids[row]]
+            for column, value in values.items():
+                cached[column] = value
+                edited.add(column)
+        self.dataChanged.emit(self.index(rows[0], min(values)), self.index(rows[-1], max(values)),
+                              [Qt.DisplayRole, Qt.EditRole])
+
+    # Method: _columnValues
+    # Description:
+    #   Returns the values of one column for every row. Cached rows are used as is
+    #   (they may hold unsaved edits); the others are read from the layer in a
+    #   single request for that attribute only, without caching the rows.
+    def _columnValues(self, column):
+        values = [row[column] if row is not None else "" for row in self.rows]
+        missing = [fid for fid, row in zip(self.feat_ids, self.rows) if row is None]
+        if missing:
+            idx = self._field_idx[column]
+            request = self._attributeRequest([idx]).setFilterFids(missing)
+            for feat in self.layer.getFeatures(request):
+                values[self.row_by_fid[feat.id()]] = feat[idx] or ""
+        return values
+
+    # Method: takeEdits
+    # Description:
+    #   Returns the cells edited since the last call as {feature id: {column: value}}
+    #   and forgets them, so each edit is written back to the layer only once.
+    def takeEdits(self):
+        edits = {}
+        for fid, columns in self._edited.items():
+            row = self.rows[self.row_by_fid[fid]]
+            edits[fid] = {column: row[column] for column in columns}
+        self._edited.clear()
+        return edits
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.EditRole):
+            return None
+        return self._row(index.row())[index.column()]
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or role != Qt.EditRole:
+            return False
+        self._row(index.row())[index.column()] = value
+        self._edited[self.feat_ids[index.row()]].add(index.column())
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+        return True
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsSelectable | Qt.ItemIsEnabled | Qt.ItemIsEditable
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.SizeHintRole and orientation == Qt.Horizontal:
+            return self.HEADER_SIZE_HINT
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self.COLUMNS[section]
+        return section + 1
+
+    # Method: sort
+    # Description:
+    #   Sorts rows (and their feature ids) on the given column. Persistent
+    #   indexes are remapped so the current selection follows its rows.
+    def sort(self, column, order=Qt.AscendingOrder):
+        self.layoutAboutToBeChanged.emit()
+        keys = self._columnValues(column)
+        new_order = sorted(range(len(self.rows)), key=keys.__getitem__,
+                           reverse=(order == Qt.DescendingOrder))
+        new_row_of = {old: new for new, old in enumerate(new_order)}
+        self.rows = [self.rows[i] for i in new_order]
+        self.feat_ids = [self.feat_ids[i] for i in new_order]
+        self._indexRows()
+        old_indexes = self.persistentIndexList()
+        new_indexes = [self.index(new_row_of[idx.row()], idx.column()) for idx in old_indexes]
+        self.changePersistentIndexList(old_indexes, new_indexes)
+        self.layoutChanged.emit()
 
 # -----------------------------------------------------------------------------
 # CLASS: MetadataDialog
@@ -120,85 +420,182 @@ class FeatureTableDialog(QDialog):
         self.setWindowTitle("JD Boundary Uploader - Editing Panel")
         self.setMinimumWidth(300)
         self.layout = QVBoxLayout(self)
-        # Backup for undoing the last merge
+        # Backup for undoing the last merge: the original features of the merged
+        # groups, and the ids of the features that replaced them
         self.lastMergeBackup = None
-
-        # --- ZIP Extraction and Memory Layer Creation ---
-        self._extractZipAndCreateLayer()
-
-        # --- Setup Map Canvas Zoom ---
-        zoomToWorkingLayer(self.layer)
+        self.lastMergeFids = []
+        # Set while the table and map selections are being synchronized
+        self._syncingSelection = False
+        # Label settings shared by every working layer (built on first use)
+        self._labelSettings = None
+        # Bounding boxes of the working layer features, by feature id
+        self._bboxes = {}
+        # Working layer, set once the ZIP has been loaded
+        self.layer = None
+        self._ingestTask = None
 
         # --- Setup Editing Interface ---
         self._setupEditingInterface()
 
-        # Load table data from the layer
-        self.loadTable()
+        # --- ZIP Extraction and Memory Layer Creation (in the background) ---
+        self._extractZipAndCreateLayer()
 
     # Method: _extractZipAndCreateLayer
     # Description:
-    #   Prompts the user to select a ZIP file, extracts it, and creates a memory layer
-    #   with the required fields from the shapefile found in the ZIP.
+    #   Prompts the user to select a ZIP file and starts loading the shapefile
+    #   found in the ZIP into the working memory layer.
     def _extractZipAndCreateLayer(self):
         zip_input_path, _ = QFileDialog.getOpenFileName(self, "Select FADQ ZIP", "", "Zip Files (*.zip)")
         if not zip_input_path:
             QMessageBox.critical(self, "Error", "No ZIP file selected.")
             self.close()
             return
-        temp_dir = tempfile.mkdtemp(prefix="FADQ_")
-        with zipfile.ZipFile(zip_input_path, 'r') as zip_ref:
-            zip_ref.extractall(temp_dir)
-        shp_file = None
-        for root, dirs, files in os.walk(temp_dir):
-            for file in files:
-                if file.lower().endswith('.shp'):
-                    shp_file = os.path.join(root, file)
-                    break
-            if shp_file:
-                break
-        if not shp_file:
-            QMessageBox.critical(self, "Error", "No .shp file found in ZIP.")
-            self.close()
+        self._startIngest(zip_input_path)
+
+    # Method: _cacheLayerFields
+    # Description:
+    #   Caches the working layer fields and the index of each field by name.
+    #   Called whenever a new working layer is assigned.
+    def _cacheLayerFields(self):
+        self._fields = self.layer.fields()
+        self._fieldIdx = {self._fields.at(i).name(): i for i in range(self._fields.count())}
+
+    # Method: _startIngest
+    # Description:
+    #   Reads the shapefile of the given ZIP in a background IngestTask, so large
+    #   ZIPs do not freeze QGIS. The dialog is disabled and shows the task progress
+    #   while it runs. On success the new layer becomes the working layer and
+    #   on_loaded, if given, is called.
+    def _startIngest(self, zip_path, on_loaded=None):
+        task = IngestTask(zip_path)
+        # progressChanged is emitted from the worker thread: a bound method of the
+        # dialog is queued to the GUI thread, a lambda would not be
+        task.progressChanged.connect(self._onIngestProgress)
+        task.taskCompleted.connect(lambda: self._onIngestCompleted(task, on_loaded))
+        task.taskTerminated.connect(lambda: self._onIngestTerminated(task))
+        RUNNING_TASKS.add(task)
+        task.taskCompleted.connect(lambda: RUNNING_TASKS.discard(task))
+        task.taskTerminated.connect(lambda: RUNNING_TASKS.discard(task))
+        self._ingestTask = task
+        self.progressBar.setValue(0)
+        self.progressBar.show()
+        self.setEnabled(False)
+        QgsApplication.taskManager().addTask(task)
+
+    # Method: _onIngestProgress
+    # Description:
+    #   Shows the progress of the background load.
+    def _onIngestProgress(self, progress):
+        self.progressBar.setValue(int(progress))
+
+    # Method: _onIngestCompleted
+    # Description:
+    #   Creates the working memory layer from the features read by the task.
+    #   All features are added to the provider in a single call.
+    def _onIngestCompleted(self, task, on_loaded):
+        if task is not self._ingestTask:
+            # The dialog was released while the task ran
             return
+        self._endIngest()
+        crs = "EPSG:4326"
+        geom_type = QgsWkbTypes.displayString(task.wkb_type)
+        layer = QgsVectorLayer(f"{geom_type}?crs={crs}", "Working Layer", "memory")
+        layer.dataProvider().addAttributes(task.fields)
+        layer.updateFields()
+        # Writing to the memory provider directly needs no edit session
+        ok, added_feats = layer.dataProvider().addFeatures(task.features)
+        layer.updateExtents()
+        # addFeatures keeps the order of the features, so ids match the task's boxes
+        self._bboxes = {feat.id(): bbox for feat, bbox in zip(added_feats, task.bboxes)}
+        self._setWorkingLayer(layer)
+        if on_loaded is not None:
+            on_loaded()
 
-        orig_layer = QgsVectorLayer(shp_file, "Input Layer", "ogr")
-        if not orig_layer.isValid():
-            QMessageBox.critical(self, "Error", "The extracted layer is not valid.")
-            self.close()
+    # Method: _onIngestTerminated
+    # Description:
+    #   Reports a failed or canceled load. Without a working layer to fall back
+    #   on, the dialog is closed.
+    def _onIngestTerminated(self, task):
+        if task is not self._ingestTask:
+            # The dialog was released while the task ran
             return
+        self._endIngest()
+        QMessageBox.critical(self, "Error", task.error or "Loading of the ZIP was canceled.")
+        if self.layer is None:
+            self.close()
 
-        crs = "EPSG:4326"
-        geom_type = QgsWkbTypes.displayString(orig_layer.wkbType())
-        self.layer = QgsVectorLayer(f"{geom_type}?crs={crs}", "Working Layer", "memory")
-        prov = self.layer.dataProvider()
-        fields = QgsFields()
-        fields.append(QgsField("CLIENT_NAME", QVariant.String))
-        fields.append(QgsField("FARM_NAME", QVariant.String))
-        fields.append(QgsField("FIELD_NAME", QVariant.String))
-        # POLYGONTYP is kept in the layer but not displayed in the widget
-        fields.append(QgsField("POLYGONTYP", QVariant.LongLong))
-        fields.append(QgsField("GROUPE", QVariant.String))
-        prov.addAttributes(fields)
-        self.layer.updateFields()
-
-        self.layer.startEditing()
-        for feat in orig_layer.getFeatures():
-            new_feat = QgsFeature()
-            new_feat.setGeometry(feat.geometry())
-            new_feat.setFields(self.layer.fields())
-            new_feat["CLIENT_NAME"] = ""
-            new_feat["FARM_NAME"] = ""
-            new_feat["FIELD_NAME"] = feat["NOPAR"] if feat.fields().indexOf("NOPAR") != -1 else ""
-            wkb = feat.geometry().wkbType()
-            if QgsWkbTypes.geometryType(wkb) == QgsWkbTypes.PolygonGeometry:
-                new_feat["POLYGONTYP"] = 2 if QgsWkbTypes.isMultiType(wkb) else 1
-            else:
-                new_feat["POLYGONTYP"] = 0
-            new_feat["GROUPE"] = ""
-            prov.addFeatures([new_feat])
-        self.layer.commitChanges()
-        QgsProject.instance().addMapLayer(self.layer)
+    # Method: _endIngest
+    # Description:
+    #   Restores the dialog once the background load is over.
+    def _endIngest(self):
+        self._ingestTask = None
+        self.progressBar.hide()
+        self.setEnabled(True)
+
+    # Method: _setWorkingLayer
+    # Description:
+    #   Makes the given layer the working layer: adds it to the project, applies
+    #   labels, zooms to it and loads it in the table.
+    def _setWorkingLayer(self, layer):
+        self.layer = layer
+        self._setEditingEnabled(True)
+        self._cacheLayerFields()
+        QgsProject.instance().addMapLayer(layer)
+        layer.selectionChanged.connect(self.onMapSelectionChanged)
+        # Cached bounding boxes go stale when features are edited with QGIS tools
+        layer.geometryChanged.connect(self._forgetBoundingBox)
+        layer.featureDeleted.connect(self._forgetBoundingBox)
+        # A merge backup refers to the previous layer's features
+        self.lastMergeBackup = None
+        self.lastMergeFids = []
         self.setupLabels()
+        zoomToWorkingLayer(layer)
+        self.loadTable()
+
+    # Method: release
+    # Description:
+    #   Drops the dialog's references to the working layer features (table rows,
+    #   bounding boxes, merge backup) and cancels a load in progress, so they are
+    #   freed as soon as the dialog is closed. The working layer stays in the project.
+    def release(self):
+        task = self._ingestTask
+        if task is not None:
+            # cancel() only flags the task: run() stops at its next check, and
+            # RUNNING_TASKS keeps the task alive until then. Its completion
+            # handlers ignore it once it is no longer the dialog's task.
+            self._ingestTask = None
+            task.cancel()
+        for timer in (self._highlightTimer, self._mapSelectionTimer, self._zoomTimer):
+            timer.stop()
+        self._disconnectWorkingLayer()
+        self.model.clear()
+        self._bboxes = {}
+        self.lastMergeBackup = None
+        self.lastMergeFids = []
+
+    # Method: _disconnectWorkingLayer
+    # Description:
+    #   Disconnects the working layer signals connected by _setWorkingLayer.
+    def _disconnectWorkingLayer(self):
+        if self.layer is None:
+            return
+        try:
+            self.layer.selectionChanged.disconnect(self.onMapSelectionChanged)
+            self.layer.geometryChanged.disconnect(self._forgetBoundingBox)
+            self.layer.featureDeleted.disconnect(self._forgetBoundingBox)
+        except (RuntimeError, TypeError):
+            # The layer was already removed from the project
+            pass
+
+    # Method: _setEditingEnabled
+    # Description:
+    #   Enables or disables the editing controls. They are disabled while there is
+    #   no working layer; New Process stays available to load one.
+    def _setEditingEnabled(self, enabled):
+        for widget in (self.globalClientEdit, self.globalFarmEdit, self.btnApplyGlobal,
+                       self.btnUpdateSymb, self.table, self.btnSave, self.btnMerge,
+                       self.btnTerminate, self.btnAssignGroup, self.btnUndoMerge):
+            widget.setEnabled(enabled)
 
     # Method: _setupEditingInterface
     # Description:
@@ -231,17 +628,23 @@ class FeatureTableDialog(QDialog):
         self.layout.addWidget(instructions)
 
         # Table for attribute editing
-        self.table = QTableWidget()
-        self.table.setColumnCount(4)
-        self.table.setHorizontalHeaderLabels(["CLIENT_NAME", "FARM_NAME", "FIELD_NAME", "GROUPE"])
+        self.model = FeatureModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
         self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        # Fixed row heights: never measure cell contents (no resizeRowsToContents)
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
         self.table.setSortingEnabled(True)
         self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.table.setSelectionMode(QAbstractItemView.MultiSelection)
         self.layout.addWidget(self.table)
 
-        self.table.itemSelectionChanged.connect(self.highlightFeature)
-        self.layer.selectionChanged.connect(self.onMapSelectionChanged)
+        # Selection events arrive in bursts (e.g. drag-selecting rows or a rubber band
+        # on the map); timers make sure only the final selection is synchronized.
+        self._highlightTimer = self._createDelayTimer(SELECTION_SYNC_DELAY, self._highlightSelection)
+        self._mapSelectionTimer = self._createDelayTimer(SELECTION_SYNC_DELAY, self._syncTableSelection)
+        self._zoomTimer = self._createDelayTimer(ZOOM_DELAY, self._zoomToSelection)
+        self.table.selectionModel().selectionChanged.connect(self.highlightFeature)
 
         # Basic action buttons layout
         btn_layout = QHBoxLayout()
@@ -272,39 +675,55 @@ class FeatureTableDialog(QDialog):
         self.btnNewProcess.clicked.connect(self.newProcess)
         self.layout.addWidget(self.btnNewProcess)
 
+        # Progress of the background ZIP loading (hidden when idle)
+        self.progressBar = QProgressBar()
+        self.progressBar.setRange(0, 100)
+        self.progressBar.hide()
+        self.layout.addWidget(self.progressBar)
+
+    # Method: _createDelayTimer
+    # Description:
+    #   Returns a single-shot timer calling the given slot once it has been idle
+    #   for the given delay. Restarting the timer postpones the call.
+    def _createDelayTimer(self, delay, slot):
+        timer = QTimer(self)
+        timer.setSingleShot(True)
+        timer.setInterval(delay)
+        timer.timeout.connect(slot)
+        return timer
+
     # Method: setupLabels
     # Description:
     #   Configures label settings for the working layer and applies them.
+    #   The settings are built once and reused for every working layer; labels
+    #   follow attribute edits on their own, so this is only needed per new layer.
     def setupLabels(self):
-        from qgis.core import QgsVectorLayerSimpleLabeling, QgsPalLayerSettings, QgsTextFormat
-        label_settings = QgsPalLayerSettings()
-        label_settings.fieldName = "concat('Client: ', CLIENT_NAME, '\nFarm: ', FARM_NAME, '\nField: ', FIELD_NAME)"
-        label_settings.placement = QgsPalLayerSettings.OverPoint
-        label_settings.enabled = True
-        text_format = QgsTextFormat()
-        text_format.setFont(QFont("Segoe UI", 10))
-        text_format.setColor(QColor("black"))
-        buffer_settings = text_format.buffer()
-        buffer_settings.setEnabled(False)
-        label_settings.setFormat(text_format)
-        labeling = QgsVectorLayerSimpleLabeling(label_settings)
-        self.layer.setLabeling(labeling)
+        if self._labelSettings is None:
+            label_settings = QgsPalLayerSettings()
+            label_settings.fieldName = "concat('Client: ', CLIENT_NAME, '\nFarm: ', FARM_NAME, '\nField: ', FIELD_NAME)"
+            label_settings.placement = QgsPalLayerSettings.OverPoint
+            label_settings.enabled = True
+            text_format = QgsTextFormat()
+            text_format.setFont(QFont("Segoe UI", 10))
+            text_format.setColor(QColor("black"))
+            buffer_settings = text_format.buffer()
+            buffer_settings.setEnabled(False)
+            label_settings.setFormat(text_format)
+            self._labelSettings = label_settings
+        self.layer.setLabeling(QgsVectorLayerSimpleLabeling(self._labelSettings))
         self.layer.setLabelsEnabled(True)
         self.layer.triggerRepaint()
-        iface.mapCanvas().refresh()
 
     # Method: loadTable
     # Description:
-    #   Loads the attributes from the working layer into the table widget.
+    #   Loads the attributes from the working layer into the table model.
+    #   Rows are loaded unsorted in a single model reset, then the column sort
+    #   selected in the header is applied once.
     def loadTable(self):
-        feats = list(self.layer.getFeatures())
-        self.table.setRowCount(len(feats))
-        self.feat_ids = [feat.id() for feat in feats]
-        for i, feat in enumerate(feats):
-            self.table.setItem(i, 0, QTableWidgetItem(feat.attribute("CLIENT_NAME") or ""))
-            self.table.setItem(i, 1, QTableWidgetItem(feat.attribute("FARM_NAME") or ""))
-            self.table.setItem(i, 2, QTableWidgetItem(feat.attribute("FIELD_NAME") or ""))
-            self.table.setItem(i, 3, QTableWidgetItem(feat.attribute("GROUPE") or ""))
+        self.model.loadLayer(self.layer)
+        if self.table.isSortingEnabled():
+            header = self.table.horizontalHeader()
+            self.model.sort(header.sortIndicatorSection(), header.sortIndicatorOrder())
 
     # Method: applyGlobalValues
     # Description:
@@ -312,15 +731,11 @@ class FeatureTableDialog(QDialog):
     def applyGlobalValues(self):
         global_client = self.globalClientEdit.text()
         global_farm = self.globalFarmEdit.text()
-        selected_indexes = self.table.selectionModel().selectedRows()
-        if not selected_indexes:
-            selected_indexes = [self.table.model().index(row, 0) for row in range(self.table.rowCount())]
-        for index in selected_indexes:
-            row = index.row()
-            self.table.item(row, 0).setText(global_client)
-            self.table.item(row, 1).setText(global_farm)
+        rows = [index.row() for index in self.table.selectionModel().selectedRows()]
+        if not rows:
+            rows = range(self.model.rowCount())
+        self.model.setValues(rows, {0: global_client, 1: global_farm})
         self.saveEdits()
-        self.setupLabels()
 
     # Method: assignGroup
     # Description:
@@ -333,14 +748,13 @@ class FeatureTableDialog(QDialog):
         if not selected_indexes:
             QMessageBox.information(self, "Info", "No rows selected.")
             return
-        for index in selected_indexes:
-            row = index.row()
-            self.table.item(row, 3).setText(group_name)
+        self.model.setValues([index.row() for index in selected_indexes], {3: group_name})
         self.saveEdits()
 
     # Method: undoMerge
     # Description:
-    #   Reverts the last merge operation by restoring the layer state from backup.
+    #   Reverts the last merge operation by replacing the merged features with
+    #   the original features kept as backup.
     def undoMerge(self):
         if self.lastMergeBackup:
             reply = QMessageBox.question(
@@ -350,100 +764,180 @@ class FeatureTableDialog(QDialog):
                 QMessageBox.Yes | QMessageBox.No
             )
             if reply == QMessageBox.Yes:
-                self.layer.startEditing()
-                all_ids = [feat.id() for feat in self.layer.getFeatures()]
-                self.layer.deleteFeatures(all_ids)
-                self.layer.dataProvider().addFeatures(self.lastMergeBackup)
-                self.layer.commitChanges()
+                prov = self.layer.dataProvider()
+                prov.deleteFeatures(self.lastMergeFids)
+                prov.addFeatures(self.lastMergeBackup)
+                self.layer.updateExtents()
+                self.layer.triggerRepaint()
                 self.refreshTable()
                 QMessageBox.information(self, "Info", "Last merge undone.")
                 self.lastMergeBackup = None
+                self.lastMergeFids = []
         else:
             QMessageBox.information(self, "Info", "No merge to undo.")
 
     # Method: updateSymbology
     # Description:
     #   Updates the layer symbology based on the distinct FARM_NAME values.
+    #   When the layer already has a FARM_NAME categorized renderer, only the
+    #   categories of farms that appeared or disappeared are changed.
     def updateSymbology(self):
-        farms = set()
-        for feat in self.layer.getFeatures():
-            f = feat.attribute("FARM_NAME") or ""
-            if f.strip():
-                farms.add(f.strip())
-        categories = []
-        for farm in farms:
-            r = random.randint(0, 255)
-            g = random.randint(0, 255)
-            b = random.randint(0, 255)
-            color = QColor(r, g, b)
-            symbol = QgsSymbol.defaultSymbol(self.layer.geometryType())
-            if symbol.symbolLayerCount() > 0:
-                symbol.symbolLayer(0).setFillColor(QColor(0, 0, 0, 0))
-                symbol.symbolLayer(0).setStrokeColor(color)
-                symbol.symbolLayer(0).setStrokeWidth(1.0)
-            category = QgsRendererCategory(farm, symbol, farm)
-            categories.append(category)
-        if categories:
-            renderer = QgsCategorizedSymbolRenderer("FARM_NAME", categories)
-            self.layer.setRenderer(renderer)
-            self.layer.triggerRepaint()
-            iface.mapCanvas().refresh()
-        else:
+        farm_idx = self._fieldIdx["FARM_NAME"]
+        farms = {str(value).strip() for value in self.layer.uniqueValues(farm_idx) if value}
+        farms.discard("")
+        if not farms:
             QMessageBox.information(self, "Symbology", "No FARM_NAME provided for symbology update.")
+            return
+        template = QgsSymbol.defaultSymbol(self.layer.geometryType())
+        if template.symbolLayerCount() > 0:
+            template.symbolLayer(0).setFillColor(QColor(0, 0, 0, 0))
+            template.symbolLayer(0).setStrokeWidth(1.0)
+        rnd = random.Random()
+        renderer = self.layer.renderer()
+        if isinstance(renderer, QgsCategorizedSymbolRenderer) and renderer.classAttribute() == "FARM_NAME":
+            renderer = renderer.clone()
+            # Remove categories from the end so the remaining indices stay valid
+            current = set()
+            categories = renderer.categories()
+            for i in reversed(range(len(categories))):
+                value = categories[i].value()
+                if value in farms:
+                    current.add(value)
+                else:
+                    renderer.deleteCategory(i)
+            for farm in sorted(farms - current):
+                renderer.addCategory(self._farmCategory(farm, template, rnd))
+        else:
+            categories = [self._farmCategory(farm, template, rnd) for farm in sorted(farms)]
+            renderer = QgsCategorizedSymbolRenderer("FARM_NAME", categories)
+        # Installing the renderer (rather than editing the current one) notifies
+        # the Layers panel, so the legend lists the new farm categories
+        self.layer.setRenderer(renderer)
+        self.layer.triggerRepaint()
+
+    # Method: _farmCategory
+    # Description:
+    #   Builds the renderer category of a farm from a clone of the template symbol,
+    #   outlined with the farm's color.
+    def _farmCategory(self, farm, template, rnd):
+        # Seeding with the farm name keeps each farm's color stable between updates
+        rnd.seed(farm)
+        color = QColor(rnd.randint(0, 255), rnd.randint(0, 255), rnd.randint(0, 255))
+        symbol = template.clone()
+        if symbol.symbolLayerCount() > 0:
+            symbol.symbolLayer(0).setStrokeColor(color)
+        return QgsRendererCategory(farm, symbol, farm)
 
     # Method: highlightFeature
     # Description:
-    #   Highlights the feature corresponding to the first selected row in the table.
+    #   Schedules the highlighting of the feature matching the table selection.
     def highlightFeature(self):
-        self.table.blockSignals(True)
-        selected = self.table.selectionModel().selectedRows()
-        if not selected:
+        if self._syncingSelection:
+            return
+        self._highlightTimer.start()
+
+    # Method: _highlightSelection
+    # Description:
+    #   Highlights the feature corresponding to the first selected row in the table.
+    def _highlightSelection(self):
+        self._syncingSelection = True
+        try:
+            selected = self.table.selectionModel().selectedRows()
+            if not selected:
+                self.layer.removeSelection()
+                return
+            row = selected[0].row()
+            fid = self.model.feat_ids[row]
             self.layer.removeSelection()
-            self.table.blockSignals(False)
+            self.layer.selectByIds([fid])
+        finally:
+            self._syncingSelection = False
+        self._zoomTimer.start()
+
+    # Method: _zoomToSelection
+    # Description:
+    #   Zooms the map canvas to the features selected in the working layer. A single
+    #   selected feature is zoomed to from its cached bounding box, which avoids
+    #   scanning the layer for the selection extent.
+    def _zoomToSelection(self):
+        selected = self.layer.selectedFeatureIds()
+        if not selected:
+            return
+        rect = self._featureBoundingBox(selected[0]) if len(selected) == 1 else None
+        if rect is None or rect.isEmpty():
+            iface.mapCanvas().zoomToSelected(self.layer)
             return
-        row = selected[0].row()
-        fid = self.feat_ids[row]
-        self.layer.removeSelection()
-        self.layer.selectByIds([fid])
-        iface.mapCanvas().zoomToSelected(self.layer)
-        self.table.blockSignals(False)
+        canvas = iface.mapCanvas()
+        extent = canvas.mapSettings().layerExtentToOutputExtent(self.layer, rect)
+        extent.scale(1.2)
+        canvas.setExtent(extent)
+        canvas.refresh()
+
+    # Method: _featureBoundingBox
+    # Description:
+    #   Returns the bounding box of a working layer feature, caching features
+    #   created after the initial load (e.g. by a merge) on first use.
+    def _featureBoundingBox(self, fid):
+        rect = self._bboxes.get(fid)
+        if rect is None:
+            # Geometry only: no attributes are needed to compute the extent
+            request = QgsFeatureRequest(fid).setSubsetOfAttributes([])
+            for feat in self.layer.getFeatures(request):
+                if feat.hasGeometry():
+                    rect = feat.geometry().boundingBox()
+                    self._bboxes[fid] = rect
+        return rect
+
+    # Method: _forgetBoundingBox
+    # Description:
+    #   Drops the cached bounding box of a feature whose geometry was changed or
+    #   which was deleted; it is recomputed on next use.
+    def _forgetBoundingBox(self, fid, geometry=None):
+        self._bboxes.pop(fid, None)
 
     # Method: onMapSelectionChanged
     # Description:
-    #   Synchronizes the selection in the table with the layer selection.
+    #   Schedules the synchronization of the table selection with the layer selection.
     def onMapSelectionChanged(self, selected, deselected, clearAndSelect):
-        self.table.blockSignals(True)
-        self.table.clearSelection()
-        for i, fid in enumerate(self.feat_ids):
-            if fid in selected:
-                self.table.selectRow(i)
-        self.table.blockSignals(False)
+        if self._syncingSelection:
+            return
+        self._mapSelectionTimer.start()
+
+    # Method: _syncTableSelection
+    # Description:
+    #   Synchronizes the selection in the table with the layer selection.
+    #   The new selection is applied in a single selection model update.
+    #   Consecutive rows are merged into one range.
+    def _syncTableSelection(self):
+        row_by_fid = self.model.row_by_fid
+        rows = sorted(row_by_fid[fid] for fid in self.layer.selectedFeatureIds() if fid in row_by_fid)
+        # Collapse consecutive rows into ranges to keep the selection compact
+        selection = QItemSelection()
+        last_column = self.model.columnCount() - 1
+        start = 0
+        for i in range(1, len(rows) + 1):
+            if i == len(rows) or rows[i] != rows[i - 1] + 1:
+                selection.select(self.model.index(rows[start], 0), self.model.index(rows[i - 1], last_column))
+                start = i
+        self._syncingSelection = True
+        try:
+            self.table.selectionModel().select(
+                selection, QItemSelectionModel.ClearAndSelect | QItemSelectionModel.Rows)
+        finally:
+            self._syncingSelection = False
 
     # Method: saveEdits
     # Description:
-    #   Saves changes made in the table back to the layer's attributes.
+    #   Saves changes made in the table back to the layer's attributes. Only the
+    #   cells edited since the last save are written.
     def saveEdits(self):
-        self.layer.startEditing()
-        feats = list(self.layer.getFeatures())
-        for i, fid in enumerate(self.feat_ids):
-            for feat in feats:
-                if feat.id() == fid:
-                    feat["CLIENT_NAME"] = self.table.item(i, 0).text()
-                    feat["FARM_NAME"] = self.table.item(i, 1).text()
-                    feat["FIELD_NAME"] = self.table.item(i, 2).text()
-                    feat["GROUPE"] = self.table.item(i, 3).text()
-                    self.layer.updateFeature(feat)
-                    break
-        self.layer.commitChanges()
-
-    # Method: clone_feature (class version)
-    # Description:
-    #   Clones a given feature. Note: A global clone_feature function exists.
-    def clone_feature(feat):
-        new_feat = QgsFeature(feat.fields())
-        new_feat.setGeometry(feat.geometry())
-        new_feat.setAttributes(feat.attributes())
-        return new_feat
+        field_idx = [self._fieldIdx[name] for name in FeatureModel.COLUMNS]
+        changes = {fid: {field_idx[column]: value for column, value in edits.items()}
+                   for fid, edits in self.model.takeEdits().items()}
+        if not changes:
+            return
+        self.layer.dataProvider().changeAttributeValues(changes)
+        self.layer.triggerRepaint()
 
     # Method: mergeGroups
     # Description:
@@ -452,38 +946,54 @@ class FeatureTableDialog(QDialog):
     #   and the GROUP attribute is preserved.
     def mergeGroups(self):
         self.saveEdits()
-        self.lastMergeBackup = [clone_feature(feat) for feat in self.layer.getFeatures()]
+        # First pass on attributes only: find which features belong to a group.
+        # The provider filters out ungrouped features before they reach Python.
+        group_idx = self._fieldIdx["GROUPE"]
+        request = QgsFeatureRequest().setFilterExpression("trim(coalesce(\"GROUPE\", '')) <> ''")
+        request.setFlags(QgsFeatureRequest.NoGeometry).setSubsetOfAttributes([group_idx])
         groups = defaultdict(list)
-        for feat in self.layer.getFeatures():
-            group_val = (feat.attribute("GROUPE") or "").strip()
-            if group_val:
-                groups[group_val].append(feat)
-        for group, feats in groups.items():
-            if len(feats) < 2:
+        for feat in self.layer.getFeatures(request):
+            groups[feat[group_idx].strip()].append(feat.id())
+        # Second pass: fetch geometries only for the features that will be merged
+        merge_fids = [fid for fids in groups.values() if len(fids) >= 2 for fid in fids]
+        feats_by_id = {feat.id(): feat for feat in self.layer.getFeatures(QgsFeatureRequest().setFilterFids(merge_fids))}
+        client_idx = self._fieldIdx["CLIENT_NAME"]
+        farm_idx = self._fieldIdx["FARM_NAME"]
+        field_idx = self._fieldIdx["FIELD_NAME"]
+        fids_to_delete = []
+        new_feats = []
+        for group, fids in groups.items():
+            if len(fids) < 2:
                 continue
-            merged_geom = feats[0].geometry()
-            field_names = [feat.attribute("FIELD_NAME") for feat in feats if feat.attribute("FIELD_NAME")]
-            merged_field_names = "-".join(field_names)
-            for feat in feats[1:]:
-                merged_geom = merged_geom.combine(feat.geometry())
-            new_poly_type = 0
-            if QgsWkbTypes.geometryType(merged_geom.wkbType()) == QgsWkbTypes.PolygonGeometry:
-                new_poly_type = 2 if QgsWkbTypes.isMultiType(merged_geom.wkbType()) else 1
+            feats = [feats_by_id[fid] for fid in fids]
+            first_attrs = feats[0].attributes()
+            merged_field_names = "-".join(
+                name for name in (feat[field_idx] for feat in feats) if name)
+            # Cascaded union of the whole group rather than a pairwise combine() fold
+            merged_geom = QgsGeometry.unaryUnion([feat.geometry() for feat in feats])
+            new_poly_type = polygon_type(merged_geom.wkbType())
             new_attrs = [
-                feats[0].attribute("CLIENT_NAME"),
-                feats[0].attribute("FARM_NAME"),
+                first_attrs[client_idx],
+                first_attrs[farm_idx],
                 merged_field_names,
                 new_poly_type,
                 group
             ]
-            new_feat = QgsFeature(self.layer.fields())
+            new_feat = QgsFeature(self._fields)
             new_feat.setGeometry(merged_geom)
             new_feat.setAttributes(new_attrs)
-            self.layer.startEditing()
-            fids_to_delete = [f.id() for f in feats]
-            self.layer.deleteFeatures(fids_to_delete)
-            self.layer.addFeature(new_feat)
-            self.layer.commitChanges()
+            fids_to_delete.extend(fids)
+            new_feats.append(new_feat)
+        # Apply all groups at once, straight on the memory provider
+        prov = self.layer.dataProvider()
+        prov.deleteFeatures(fids_to_delete)
+        ok, added_feats = prov.addFeatures(new_feats)
+        # Only the merged features change, so only they are kept for undo; the
+        # fetched features are independent copies and need no cloning.
+        self.lastMergeBackup = [feats_by_id[fid] for fid in fids_to_delete]
+        self.lastMergeFids = [feat.id() for feat in added_feats]
+        self.layer.updateExtents()
+        self.layer.triggerRepaint()
         QMessageBox.information(self, "Info", "Groups merged.")
         self.refreshTable()
 
@@ -491,11 +1001,10 @@ class FeatureTableDialog(QDialog):
     # Description:
     #   Clears the GROUP attribute for all features in the layer.
     def clearGroupBeforeTerminate(self):
-        self.layer.startEditing()
-        for feat in self.layer.getFeatures():
-            feat["GROUPE"] = ""
-            self.layer.updateFeature(feat)
-        self.layer.commitChanges()
+        group_idx = self._fieldIdx["GROUPE"]
+        changes = {fid: {group_idx: ""} for fid in self.layer.allFeatureIds()}
+        self.layer.dataProvider().changeAttributeValues(changes)
+        self.layer.triggerRepaint()
 
     # Method: terminateAndClearGroup
     # Description:
@@ -507,7 +1016,6 @@ class FeatureTableDialog(QDialog):
         if hasattr(self, "exported_shp_path"):
             new_name = os.path.splitext(os.path.basename(self.exported_shp_path))[0]
             self.layer.setName(new_name)
-            self.setupLabels()
             QMessageBox.information(self, "Info", f"Working layer renamed to {new_name}.")
         self.btnNewProcess.setEnabled(True)
 
@@ -520,7 +1028,15 @@ class FeatureTableDialog(QDialog):
         if not shp_output_path:
             QMessageBox.critical(self, "Error", "No save path provided for shapefile.")
             return
-        error = QgsVectorFileWriter.writeAsVectorFormat(self.layer, shp_output_path, "UTF-8", self.layer.crs(), "ESRI Shapefile")
+        if hasattr(QgsVectorFileWriter, "writeAsVectorFormatV3"):
+            options = QgsVectorFileWriter.SaveVectorOptions()
+            options.driverName = "ESRI Shapefile"
+            options.fileEncoding = "UTF-8"
+            error = QgsVectorFileWriter.writeAsVectorFormatV3(
+                self.layer, shp_output_path, QgsProject.instance().transformContext(), options)
+        else:
+            # QGIS < 3.20
+            error = QgsVectorFileWriter.writeAsVectorFormat(self.layer, shp_output_path, "UTF-8", self.layer.crs(), "ESRI Shapefile")
         if error[0] != QgsVectorFileWriter.NoError:
             QMessageBox.critical(self, "Error", f"Export error: {error}")
             return
@@ -528,15 +1044,8 @@ class FeatureTableDialog(QDialog):
             QMessageBox.information(self, "Success", "Shapefile exported.")
             self.exported_shp_path = shp_output_path
 
-        client_values = set()
-        farm_values = set()
-        for feat in self.layer.getFeatures():
-            val_client = feat.attribute("CLIENT_NAME")
-            val_farm = feat.attribute("FARM_NAME")
-            if val_client:
-                client_values.add(val_client)
-            if val_farm:
-                farm_values.add(val_farm)
+        client_values = {value for value in self.layer.uniqueValues(self._fieldIdx["CLIENT_NAME"]) if value}
+        farm_values = {value for value in self.layer.uniqueValues(self._fieldIdx["FARM_NAME"]) if value}
         default_client = client_values.pop() if len(client_values) == 1 else ""
         default_farm = farm_values.pop() if len(farm_values) == 1 else ""
 
@@ -554,22 +1063,24 @@ class FeatureTableDialog(QDialog):
         }
         base_name = os.path.splitext(os.path.basename(shp_output_path))[0]
         json_filename = os.path.join(os.path.dirname(shp_output_path), f"{base_name}-Deere-Metadata.json")
+        # Serialized once: written next to the shapefile and copied into the ZIP from memory
+        metadata_json = json.dumps(metadata, indent=4)
         with open(json_filename, "w") as json_file:
-            json.dump(metadata, json_file, indent=4)
+            json_file.write(metadata_json)
         QMessageBox.information(self, "Success", "Metadata JSON created.")
 
         zip_output_path, _ = QFileDialog.getSaveFileName(self, "Save ZIP archive", os.path.dirname(shp_output_path), "Zip Files (*.zip)")
         if not zip_output_path:
             QMessageBox.critical(self, "Error", "No save path provided for ZIP.")
             return
-        import zipfile
-        with zipfile.ZipFile(zip_output_path, 'w') as zipf:
+        # Shapefile parts (the .dbf especially) compress well; level 1 keeps CPU cost low.
+        # ZipFile.write streams each file in chunks, so files are never held fully in memory.
+        with zipfile.ZipFile(zip_output_path, 'w', compression=zipfile.ZIP_DEFLATED, compresslevel=1) as zipf:
             for ext in ['.shp', '.shx', '.dbf', '.prj']:
                 file_path = os.path.splitext(shp_output_path)[0] + ext
                 if os.path.exists(file_path):
                     zipf.write(file_path, arcname=os.path.basename(file_path))
-            if os.path.exists(json_filename):
-                zipf.write(json_filename, arcname=os.path.basename(json_filename))
+            zipf.writestr(os.path.basename(json_filename), metadata_json)
         QMessageBox.information(self, "Success", f"ZIP archive created at:\n{zip_output_path}")
 
     # Method: resetInterface
@@ -579,15 +1090,12 @@ class FeatureTableDialog(QDialog):
         self.globalClientEdit.clear()
         self.globalFarmEdit.clear()
         self.refreshTable()
-        self.setupLabels()
-        iface.mapCanvas().setExtent(self.layer.extent())
-        iface.mapCanvas().refresh()
+        zoomToWorkingLayer(self.layer)
 
     # Method: refreshTable
     # Description:
-    #   Clears and reloads the table data from the working layer.
+    #   Reloads the table data from the working layer.
     def refreshTable(self):
-        self.table.setRowCount(0)
         self.loadTable()
 
     # Method: newProcess
@@ -601,68 +1109,33 @@ class FeatureTableDialog(QDialog):
             QMessageBox.Yes | QMessageBox.No
         )
         if reply == QMessageBox.Yes:
+            # Nothing may use the layer once it is removed from the project (which deletes it)
+            self._disconnectWorkingLayer()
             try:
                 if self.layer and self.layer.isValid() and self.layer.id() in QgsProject.instance().mapLayerIds():
                     QgsProject.instance().removeMapLayer(self.layer.id())
             except Exception as e:
                 print("Layer removal issue:", e)
+            self.layer = None
+            self.model.clear()
+            for timer in (self._highlightTimer, self._mapSelectionTimer, self._zoomTimer):
+                timer.stop()
+            self._bboxes = {}
+            self.lastMergeBackup = None
+            self.lastMergeFids = []
+            self._setEditingEnabled(False)
             new_zip, _ = QFileDialog.getOpenFileName(self, "Select new FADQ ZIP", "", "Zip Files (*.zip)")
             if not new_zip:
+                # Without a working layer only New Process remains available
                 return
-            temp_dir = tempfile.mkdtemp(prefix="FADQ_")
-            with zipfile.ZipFile(new_zip, 'r') as zip_ref:
-                zip_ref.extractall(temp_dir)
-            shp_file = None
-            for root, dirs, files in os.walk(temp_dir):
-                for file in files:
-                    if file.lower().endswith('.shp'):
-                        shp_file = os.path.join(root, file)
-                        break
-                if shp_file:
-                    break
-            if not shp_file:
-                QMessageBox.critical(self, "Error", "No .shp file found in ZIP.")
-                return
-            new_orig_layer = QgsVectorLayer(shp_file, "Input Layer", "ogr")
-            if not new_orig_layer.isValid():
-                QMessageBox.critical(self, "Error", "The extracted layer is not valid.")
-                return
-            crs = "EPSG:4326"
-            geom_type = QgsWkbTypes.displayString(new_orig_layer.wkbType())
-            new_layer = QgsVectorLayer(f"{geom_type}?crs={crs}", "Working Layer", "memory")
-            prov = new_layer.dataProvider()
-            fields = QgsFields()
-            fields.append(QgsField("CLIENT_NAME", QVariant.String))
-            fields.append(QgsField("FARM_NAME", QVariant.String))
-            fields.append(QgsField("FIELD_NAME", QVariant.String))
-            fields.append(QgsField("POLYGONTYP", QVariant.LongLong))
-            fields.append(QgsField("GROUPE", QVariant.String))
-            prov.addAttributes(fields)
-            new_layer.updateFields()
-            new_layer.startEditing()
-            for feat in new_orig_layer.getFeatures():
-                new_feat = QgsFeature()
-                new_feat.setGeometry(feat.geometry())
-                new_feat.setFields(new_layer.fields())
-                new_feat["CLIENT_NAME"] = ""
-                new_feat["FARM_NAME"] = ""
-                new_feat["FIELD_NAME"] = feat["NOPAR"] if feat.fields().indexOf("NOPAR") != -1 else ""
-                wkb = feat.geometry().wkbType()
-                if QgsWkbTypes.geometryType(wkb) == QgsWkbTypes.PolygonGeometry:
-                    new_feat["POLYGONTYP"] = 2 if QgsWkbTypes.isMultiType(wkb) else 1
-                else:
-                    new_feat["POLYGONTYP"] = 0
-                new_feat["GROUPE"] = ""
-                prov.addFeatures([new_feat])
-            new_layer.commitChanges()
-            QgsProject.instance().addMapLayer(new_layer)
-            new_layer.selectionChanged.connect(self.onMapSelectionChanged)
-            self.layer = new_layer
-            self.setupLabels()
-            zoomToWorkingLayer(self.layer)
-            self.loadTable()
-            self.btnNewProcess.setEnabled(False)
-            QMessageBox.information(self, "Info", "New process loaded successfully.")
+            self._startIngest(new_zip, self._onNewProcessLoaded)
+
+    # Method: _onNewProcessLoaded
+    # Description:
+    #   Called once the ZIP of a new process has been loaded.
+    def _onNewProcessLoaded(self):
+        self.btnNewProcess.setEnabled(False)
+        QMessageBox.information(self, "Info", "New process loaded successfully.")
 
 if __name__ == '__main__':
     dialog = FeatureTableDialog()
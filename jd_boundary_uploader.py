@@ -39,6 +39,14 @@ import os.path
 from . import resources
 from .jd_boundary_uploader_dockwidget import JDOperationsCenterUploaderDockWidget
 
+# Translators loaded so far, by locale (None when the plugin has no translation
+# for the locale), so a new plugin instance does not look up the .qm file again.
+_TRANSLATORS = {}
+
+# Whether the plugin's Qt resources are registered. Importing resources registers
+# them; unload() unregisters them so a reloaded plugin does not register them twice.
+_resourcesRegistered = True
+
 # -----------------------------------------------------------------------------
 # CLASS: JDOperationsCenterUploader
 # -----------------------------------------------------------------------------
@@ -60,13 +68,18 @@ class JDOperationsCenterUploader:
         self.plugin_dir = os.path.dirname(__file__)
         # Install translator based on user locale.
         locale = QSettings().value('locale/userLocale')[0:2]
-        locale_path = os.path.join(self.plugin_dir, 'i18n', f'JDOperationsCenterUploader_{locale}.qm')
-        if os.path.exists(locale_path):
-            self.translator = QTranslator()
-            self.translator.load(locale_path)
+        if locale not in _TRANSLATORS:
+            locale_path = os.path.join(self.plugin_dir, 'i18n', f'JDOperationsCenterUploader_{locale}.qm')
+            translator = QTranslator()
+            # load() returns False when the .qm file does not exist
+            _TRANSLATORS[locale] = translator if translator.load(locale_path) else None
+        self.translator = _TRANSLATORS[locale]
+        if self.translator is not None:
             QCoreApplication.installTranslator(self.translator)
             
         self.actions = []
+        # Icons already created by add_action, by path
+        self._icons = {}
         self.menu = self.tr(u'&JD Boundary Uploader')
         # Create a dedicated toolbar in QGIS toolbar area.
         self.toolbar = self.iface.addToolBar(u'JDOperationsCenterUploader')
@@ -87,13 +100,25 @@ class JDOperationsCenterUploader:
     # -----------------------------------------------------------------------------
     # Description:
     #   Initializes the GUI for the plugin by adding the action to the toolbar and menu.
+    #   Main window updates are suspended meanwhile, so adding several actions
+    #   relayouts and repaints the menu and toolbar only once.
     def initGui(self):
-        # Set the icon path (ensure the icon exists in the resources)
-        icon_path = ':/plugins/jd_boundary_uploader/icon.png'
-        self.add_action(icon_path,
-                        text=self.tr(u'JD Boundary Uploader'),
-                        callback=self.run,
-                        parent=self.iface.mainWindow())
+        global _resourcesRegistered
+        if not _resourcesRegistered:
+            # The plugin was unloaded and loaded again without re-importing resources
+            resources.qInitResources()
+            _resourcesRegistered = True
+        main_window = self.iface.mainWindow()
+        main_window.setUpdatesEnabled(False)
+        try:
+            # Set the icon path (ensure the icon exists in the resources)
+            icon_path = ':/plugins/jd_boundary_uploader/icon.png'
+            self.add_action(icon_path,
+                            text=self.tr(u'JD Boundary Uploader'),
+                            callback=self.run,
+                            parent=main_window)
+        finally:
+            main_window.setUpdatesEnabled(True)
 
     # -----------------------------------------------------------------------------
     # METHOD: add_action
@@ -102,8 +127,10 @@ class JDOperationsCenterUploader:
     #   Creates an action (with an icon) and adds it to the plugin's toolbar and menu.
     def add_action(self, icon_path, text, callback, enabled_flag=True,
                    add_to_menu=True, add_to_toolbar=True, parent=None):
-        from qgis.PyQt.QtGui import QIcon
-        action = QAction(QIcon(icon_path), text, parent)
+        icon = self._icons.get(icon_path)
+        if icon is None:
+            icon = self._icons[icon_path] = QIcon(icon_path)
+        action = QAction(icon, text, parent)
         action.triggered.connect(callback)
         action.setEnabled(enabled_flag)
         if add_to_toolbar:
@@ -131,17 +158,27 @@ class JDOperationsCenterUploader:
     # METHOD: onClosePlugin
     # -----------------------------------------------------------------------------
     # Description:
-    #   Callback function when the dock widget is closed. Resets plugin state.
+    #   Callback function when the dock widget is closed. Resets plugin state and
+    #   disposes of the dock widget, so the next run() starts from a new one.
     def onClosePlugin(self):
         self.pluginIsActive = False
+        if self.dockwidget is not None:
+            self.iface.removeDockWidget(self.dockwidget)
+            self.dockwidget.deleteLater()
+            self.dockwidget = None
 
     # -----------------------------------------------------------------------------
     # METHOD: unload
     # -----------------------------------------------------------------------------
     # Description:
-    #   Unloads the plugin by removing its actions from the QGIS interface.
+    #   Unloads the plugin by removing its actions from the QGIS interface and
+    #   unregistering its Qt resources.
     def unload(self):
+        global _resourcesRegistered
         for action in self.actions:
-            self.iface.removePluginMenu(self.tr(u'&JD Boundary Uploader'), action)
+            self.iface.removePluginMenu(self.menu, action)
             self.iface.removeToolBarIcon(action)
         del self.toolbar
+        if _resourcesRegistered:
+            resources.qCleanupResources()
+            _resourcesRegistered = False
@@ -30,7 +30,7 @@
 
 import os
 from qgis.PyQt import QtWidgets, uic
-from qgis.PyQt.QtCore import pyqtSignal
+from qgis.PyQt.QtCore import pyqtSignal, QTimer
 
 # -----------------------------------------------------------------------------
 # Load UI from the .ui file
@@ -44,7 +44,8 @@ FORM_CLASS, _ = uic.loadUiType(os.path.join(
 # Description:
 #   Implements the dockable widget for the JD Boundary Uploader plugin.
 #   This widget loads its interface from a Qt Designer .ui file and embeds the
-#   FeatureTableDialog for interactive editing.
+#   FeatureTableDialog for interactive editing. The FeatureTableDialog is only
+#   created once the dock has been shown.
 class JDOperationsCenterUploaderDockWidget(QtWidgets.QDockWidget, FORM_CLASS):
 
     # Signal emitted when the dock widget is closing
@@ -54,28 +55,65 @@ class JDOperationsCenterUploaderDockWidget(QtWidgets.QDockWidget, FORM_CLASS):
     # METHOD: __init__
     # -----------------------------------------------------------------------------
     # Description:
-    #   Constructor. Initializes the dock widget, loads the UI, creates an instance
-    #   of the FeatureTableDialog, and embeds it within a container widget.
+    #   Constructor. Initializes the dock widget, loads the UI, and creates the
+    #   container widget that will hold the FeatureTableDialog.
     def __init__(self, parent=None):
         super(JDOperationsCenterUploaderDockWidget, self).__init__(parent)
         self.setupUi(self)
-        # Import and create the editing widget
-        from .feature_table_dialog import FeatureTableDialog
-        self.featureDialog = FeatureTableDialog()
+        # The editing widget is created on first show (see _buildFeatureDialog)
+        self.featureDialog = None
+        self._featureDialogScheduled = False
         # Create a container widget with a vertical layout to hold the editing widget
         container = QtWidgets.QWidget()
-        layout = QtWidgets.QVBoxLayout(container)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.addWidget(self.featureDialog)
+        self._containerLayout = QtWidgets.QVBoxLayout(container)
+        self._containerLayout.setContentsMargins(0, 0, 0, 0)
         # Set the container as the central widget of the dock
         self.setWidget(container)
 
+    # -----------------------------------------------------------------------------
+    # METHOD: showEvent
+    # -----------------------------------------------------------------------------
+    # Description:
+    #   Schedules the creation of the FeatureTableDialog the first time the dock
+    #   is shown. It runs from the event loop, so the dock is painted before the
+    #   editing module is imported and the ZIP selection dialog opens.
+    def showEvent(self, event):
+        super(JDOperationsCenterUploaderDockWidget, self).showEvent(event)
+        if self.featureDialog is None and not self._featureDialogScheduled:
+            self._featureDialogScheduled = True
+            QTimer.singleShot(0, self._buildFeatureDialog)
+
+    # -----------------------------------------------------------------------------
+    # METHOD: _buildFeatureDialog
+    # -----------------------------------------------------------------------------
+    # Description:
+    #   Imports and creates the editing widget and embeds it in the container.
+    def _buildFeatureDialog(self):
+        self._featureDialogScheduled = False
+        if self.featureDialog is not None:
+            return
+        from .feature_table_dialog import FeatureTableDialog
+        self.featureDialog = FeatureTableDialog()
+        self._containerLayout.addWidget(self.featureDialog)
+
     # -----------------------------------------------------------------------------
     # METHOD: closeEvent
     # -----------------------------------------------------------------------------
     # Description:
-    #   Overrides the close event to emit a closing signal and accept the event,
-    #   allowing the plugin to perform any necessary cleanup.
+    #   Overrides the close event to release the editing widget, emit a closing
+    #   signal and accept the event, allowing the plugin to perform any necessary
+    #   cleanup. The editing widget holds the table rows and merge backup of the
+    #   working layer, which would otherwise stay in memory with the dock.
     def closeEvent(self, event):
+        if self.featureDialog is not None:
+            self.featureDialog.release()
+            self.featureDialog.setParent(None)
+            self.featureDialog.deleteLater()
+            self.featureDialog = None
         self.closingPlugin.emit()
+        try:
+            self.closingPlugin.disconnect()
+        except TypeError:
+            # No receivers were connected
+            pass
         event.accept()
@@ -22,14 +22,15 @@
 
 """
 
+import os
+import re
+import ssl
 import sys
+import http.client
+import base64
 import getpass
 import xmlrpc.client
-from optparse import OptionParser
-
-# Import standard library aliases (if needed)
-from future import standard_library
-standard_library.install_aliases()
+import argparse
 
 # -----------------------------------------------------------------------------
 # Global Configuration Variables
@@ -39,40 +40,111 @@ SERVER = 'plugins.qgis.org'
 PORT = '443'
 ENDPOINT = '/plugins/RPC2/'
 VERBOSE = False
+# Size of the package chunks read and base64-encoded at a time. A multiple of
+# 57 bytes, so the encoded lines match those of xmlrpc.client.Binary.
+UPLOAD_CHUNK_SIZE = 57 * 1024
+# "user:" (after an optional scheme) and the password that follows, up to the "@"
+USERINFO_RE = re.compile(r'^((?:[A-Za-z][A-Za-z0-9+.-]*://)?[^:/@]*:)([^@]*)(?=@)')
+
+# -----------------------------------------------------------------------------
+# CLASS: PluginUploadBody
+# -----------------------------------------------------------------------------
+class PluginUploadBody(object):
+    """
+    XML-RPC request body of a plugin.upload call, streamed from the plugin package.
+
+    The body is identical to the one xmlrpc.client would marshal for
+    Binary(package), but the package is read and base64-encoded chunk by chunk
+    each time the body is iterated, so neither the raw nor the encoded package
+    is ever held in memory. Iterating again (e.g. when the transport retries)
+    re-reads the file.
+    """
+    HEADER = (b"<?xml version='1.0'?>\n<methodCall>\n<methodName>plugin.upload</methodName>\n"
+              b"<params>\n<param>\n<value><base64>\n")
+    FOOTER = b"</base64></value>\n</param>\n</params>\n</methodCall>\n"
+
+    def __init__(self, path):
+        self.path = path
+        size = os.path.getsize(path)
+        # base64.encodebytes: 4 characters per 3 bytes, plus a newline per 57 bytes
+        self.length = len(self.HEADER) + 4 * ((size + 2) // 3) + (size + 56) // 57 + len(self.FOOTER)
+
+    def __iter__(self):
+        yield self.HEADER
+        with open(self.path, 'rb') as handle:
+            for chunk in iter(lambda: handle.read(UPLOAD_CHUNK_SIZE), b''):
+                yield base64.encodebytes(chunk)
+        yield self.FOOTER
+
+# -----------------------------------------------------------------------------
+# CLASS: StreamingTransport
+# -----------------------------------------------------------------------------
+class StreamingTransport(xmlrpc.client.SafeTransport):
+    """
+    HTTPS XML-RPC transport able to send a PluginUploadBody. The body is written
+    to the socket as it is produced, with a precomputed Content-Length.
+
+    The HTTPS connection is kept alive between requests (as in SafeTransport),
+    and a request whose connection drops (e.g. a proxy timing out during a long
+    upload) is sent again, up to MAX_ATTEMPTS times, instead of failing the upload.
+    """
+    MAX_ATTEMPTS = 3
+    # Errors raised when the connection is closed under a request
+    CONNECTION_ERRORS = (http.client.RemoteDisconnected, ssl.SSLEOFError,
+                         ConnectionResetError, ConnectionAbortedError, BrokenPipeError)
+
+    def request(self, host, handler, request_body, verbose=False):
+        for attempt in range(1, self.MAX_ATTEMPTS + 1):
+            try:
+                return self.single_request(host, handler, request_body, verbose)
+            except self.CONNECTION_ERRORS as err:
+                if attempt == self.MAX_ATTEMPTS:
+                    raise
+                # single_request already closed the broken connection
+                print("Connection lost (%s), retrying (%d/%d)" % (err, attempt + 1, self.MAX_ATTEMPTS))
+
+    def send_content(self, connection, request_body):
+        if not isinstance(request_body, PluginUploadBody):
+            return super(StreamingTransport, self).send_content(connection, request_body)
+        connection.putheader("Content-Length", str(request_body.length))
+        connection.endheaders(request_body)
 
 # -----------------------------------------------------------------------------
 # FUNCTION: main
 # -----------------------------------------------------------------------------
-def main(parameters, arguments):
+def main(parameters):
     """
     Main entry point for uploading the plugin package.
     
     Parameters:
-        parameters: Command line parameters containing username, password, etc.
-        arguments: Command line arguments; expects a single argument for the plugin ZIP file.
+        parameters: Parsed command line arguments: the plugin ZIP file (zipfile),
+                    username, password, server and port.
     """
-    address = "{protocol}://{username}:{password}@{server}:{port}{endpoint}".format(
-        protocol=PROTOCOL,
+    host = "{username}:{password}@{server}:{port}".format(
         username=parameters.username,
         password=parameters.password,
         server=parameters.server,
-        port=parameters.port,
+        port=parameters.port)
+    address = "{protocol}://{host}{endpoint}".format(
+        protocol=PROTOCOL,
+        host=host,
         endpoint=ENDPOINT)
     print("Connecting to: %s" % hide_password(address))
 
-    # Create an XML-RPC server proxy for communication
-    server = xmlrpc.client.ServerProxy(address, verbose=VERBOSE)
+    # The request is sent through the transport directly: a ServerProxy would
+    # marshal the whole base64-encoded package in memory before sending it
+    transport = StreamingTransport()
 
     try:
-        with open(arguments[0], 'rb') as handle:
-            # Upload the plugin package as a binary file
-            plugin_id, version_id = server.plugin.upload(
-                xmlrpc.client.Binary(handle.read()))
+        # Upload the plugin package, streamed from the file. The response holds
+        # a single value: the (plugin id, version id) pair.
+        (plugin_id, version_id), = transport.request(
+            host, ENDPOINT, PluginUploadBody(parameters.zipfile), verbose=VERBOSE)
         print("Plugin ID: %s" % plugin_id)
         print("Version ID: %s" % version_id)
     except xmlrpc.client.ProtocolError as err:
         print("A protocol error occurred")
-        print("URL: %s" % hide_password(err.url, 0))
+        print("URL: %s" % hide_password(err.url))
         print("HTTP/HTTPS headers: %s" % err.headers)
         print("Error code: %d" % err.errcode)
         print("Error message: %s" % err.errmsg)
@@ -84,50 +156,43 @@ def main(parameters, arguments):
 # -----------------------------------------------------------------------------
 # FUNCTION: hide_password
 # -----------------------------------------------------------------------------
-def hide_password(url, start=6):
+def hide_password(url):
     """
     Masks the password portion in a URL with asterisks.
     
     Parameters:
-        url (str): The URL containing the username and password.
-        start (int): The starting index for masking (default is 6).
+        url (str): The URL containing the username and password, with or
+                   without a scheme (error URLs start with the user name).
     
     Returns:
         str: The URL with the password portion replaced by asterisks.
     """
-    start_position = url.find(':', start) + 1
-    end_position = url.find('@')
-    return "%s%s%s" % (
-        url[:start_position],
-        '*' * (end_position - start_position),
-        url[end_position:])
+    return USERINFO_RE.sub(lambda match: match.group(1) + '*' * len(match.group(2)), url, count=1)
 
 # -----------------------------------------------------------------------------
 # MAIN EXECUTION BLOCK
 # -----------------------------------------------------------------------------
 if __name__ == "__main__":
-    parser = OptionParser(usage="%prog [options] plugin.zip")
-    parser.add_option(
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "zipfile", metavar="plugin.zip",
+        help="Plugin package to upload")
+    parser.add_argument(
         "-w", "--password", dest="password",
         help="Password for plugin site", metavar="******")
-    parser.add_option(
+    parser.add_argument(
         "-u", "--username", dest="username",
         help="Username of plugin site", metavar="user")
-    parser.add_option(
-        "-p", "--port", dest="port",
+    parser.add_argument(
+        "-p", "--port", dest="port", default=PORT,
         help="Server port to connect to", metavar="80")
-    parser.add_option(
-        "-s", "--server", dest="server",
+    parser.add_argument(
+        "-s", "--server", dest="server", default=SERVER,
         help="Specify server name", metavar="plugins.qgis.org")
-    options, args = parser.parse_args()
-    if len(args) != 1:
-        print("Please specify zip file.\n")
-        parser.print_help()
-        sys.exit(1)
-    if not options.server:
-        options.server = SERVER
-    if not options.port:
-        options.port = PORT
+    options = parser.parse_args()
+    if (not options.username or not options.password) and not sys.stdin.isatty():
+        # Nobody can answer the prompts below (e.g. on a CI runner)
+        parser.error("--username and --password are required in non-interactive mode")
     if not options.username:
         # Interactive mode to set username
         username = getpass.getuser()
@@ -140,4 +205,4 @@ if __name__ == "__main__":
     if not options.password:
         # Interactive mode to set password
         options.password = getpass.getpass()
-    main(options, args)
+    main(options)
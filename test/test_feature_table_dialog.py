@@ -0,0 +1,111 @@
+# coding=utf-8
+"""Feature table model test.
+
+.. note:: This program is free software; you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation; either version 2 of the License, or
+     (at your option) any later version.
+
+"""
+
+__author__ = 'frlandry@gmail.com'
+__date__ = '2025-02-15'
+__copyright__ = 'Copyright 2025, Frederic Landry'
+
+import types
+import unittest
+
+from qgis.PyQt.QtCore import Qt
+from qgis.core import QgsVectorLayer, QgsFeature
+
+from feature_table_dialog import FeatureModel, FeatureTableDialog, working_layer_fields
+
+from utilities import get_qgis_app
+
+QGIS_APP = get_qgis_app()
+
+# Columns of the model
+CLIENT, FARM, FIELD, GROUP = range(len(FeatureModel.COLUMNS))
+
+
+class FeatureModelTest(unittest.TestCase):
+    """Test the lazy editing model of the working layer."""
+
+    def setUp(self):
+        """Runs before each test."""
+        self.layer = QgsVectorLayer("Polygon?crs=EPSG:4326", "Working Layer", "memory")
+        self.layer.dataProvider().addAttributes(working_layer_fields())
+        self.layer.updateFields()
+        features = []
+        for i in range(5):
+            feat = QgsFeature(self.layer.fields())
+            # CLIENT_NAME, FARM_NAME, FIELD_NAME, POLYGONTYP, GROUPE
+            feat.setAttributes(["client%d" % i, "farm%d" % i, "field%d" % i, 1, ""])
+            features.append(feat)
+        ok, _ = self.layer.dataProvider().addFeatures(features)
+        self.assertTrue(ok)
+        fields = self.layer.fields()
+        self.field_idx = {fields.at(i).name(): i for i in range(fields.count())}
+        self.model = FeatureModel()
+        self.model.loadLayer(self.layer)
+
+    def tearDown(self):
+        """Runs after each test."""
+        self.model = None
+        self.layer = None
+
+    def attribute(self, fid, name):
+        """Returns the stored value of an attribute of a feature."""
+        return self.layer.getFeature(fid)[self.field_idx[name]]
+
+    def test_rows_loaded_on_demand(self):
+        """Test rows are only fetched when a cell is requested."""
+        self.assertEqual(self.model.rowCount(), 5)
+        self.assertTrue(all(row is None for row in self.model.rows))
+        fid = self.model.feat_ids[2]
+        value = self.model.data(self.model.index(2, FIELD))
+        self.assertEqual(value, self.attribute(fid, "FIELD_NAME"))
+        loaded = [i for i, row in enumerate(self.model.rows) if row is not None]
+        self.assertEqual(loaded, [2])
+
+    def test_set_values_take_edits(self):
+        """Test setValues records exactly the edited cells, once."""
+        fid0, fid2 = self.model.feat_ids[0], self.model.feat_ids[2]
+        self.model.setValues([0, 2], {CLIENT: "Client", GROUP: "G1"})
+        self.assertEqual(self.model.data(self.model.index(2, GROUP)), "G1")
+        self.assertEqual(self.model.takeEdits(), {
+            fid0: {CLIENT: "Client", GROUP: "G1"},
+            fid2: {CLIENT: "Client", GROUP: "G1"},
+        })
+        self.assertEqual(self.model.takeEdits(), {})
+
+    def test_edits_survive_sort(self):
+        """Test edits follow their feature when rows are sorted before saving."""
+        fid = self.model.feat_ids[0]
+        self.model.setValues([0], {FIELD: "zzz"})
+        self.model.sort(FIELD, Qt.DescendingOrder)
+        self.assertEqual(self.model.feat_ids[0], fid)
+        self.assertEqual(self.model.row_by_fid[fid], 0)
+        self.assertEqual(self.model.data(self.model.index(0, FIELD)), "zzz")
+        self.assertEqual(self.model.takeEdits(), {fid: {FIELD: "zzz"}})
+
+    def test_save_edits_writes_only_edited_cells(self):
+        """Test saveEdits leaves attributes that were not edited untouched."""
+        fid = self.model.feat_ids[1]
+        other_fid = self.model.feat_ids[3]
+        # Cache the row, then change an attribute behind the model's back
+        self.model.data(self.model.index(1, FARM))
+        self.layer.dataProvider().changeAttributeValues(
+            {fid: {self.field_idx["FARM_NAME"]: "changed elsewhere"}})
+        self.model.setValues([1], {CLIENT: "New client"})
+        dialog = types.SimpleNamespace(layer=self.layer, model=self.model, _fieldIdx=self.field_idx)
+        FeatureTableDialog.saveEdits(dialog)
+        self.assertEqual(self.attribute(fid, "CLIENT_NAME"), "New client")
+        self.assertEqual(self.attribute(fid, "FARM_NAME"), "changed elsewhere")
+        self.assertEqual(self.attribute(other_fid, "CLIENT_NAME"), "client3")
+        self.assertEqual(self.model.takeEdits(), {})
+
+if __name__ == "__main__":
+    suite = unittest.makeSuite(FeatureModelTest)
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite)
@@ -14,7 +14,7 @@ __copyright__ = 'Copyright 2025, Frederic Landry'
 
 import unittest
 
-from qgis.PyQt.QtGui import QDockWidget
+from qgis.PyQt.QtWidgets import QDockWidget
 
 from jd_boundary_uploader_dockwidget import JDOperationsCenterUploaderDockWidget
 
@@ -26,20 +26,22 @@ QGIS_APP = get_qgis_app()
 class JDOperationsCenterUploaderDockWidgetTest(unittest.TestCase):
     """Test dockwidget works."""
 
-    def setUp(self):
-        """Runs before each test."""
-        self.dockwidget = JDOperationsCenterUploaderDockWidget(None)
+    @classmethod
+    def setUpClass(cls):
+        """Runs once before the tests; they share one dockwidget."""
+        cls.dockwidget = JDOperationsCenterUploaderDockWidget(None)
 
-    def tearDown(self):
-        """Runs after each test."""
-        self.dockwidget = None
+    @classmethod
+    def tearDownClass(cls):
+        """Runs once after the tests."""
+        cls.dockwidget = None
 
     def test_dockwidget_ok(self):
         """Test we can click OK."""
         pass
 
 if __name__ == "__main__":
-    suite = unittest.makeSuite(JDOperationsCenterUploaderDialogTest)
+    suite = unittest.makeSuite(JDOperationsCenterUploaderDockWidgetTest)
     runner = unittest.TextTestRunner(verbosity=2)
     runner.run(suite)
 